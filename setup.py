@@ -35,6 +35,7 @@ setuptools.setup(
     package_dir={"": "src"},
     install_requires=requires,
     extras_require={
+        'async': ['httpx'],
         'dev': dev_requirements
     },
     test_suite='tests',
@@ -2,8 +2,11 @@
 import asyncio
 import logging
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 
+from decanter.core.core_api.api import CoreAPI
 from decanter.core.extra import CoreStatus
 import decanter.core.core_api.worker as worker
 
@@ -34,6 +37,14 @@ class Context:
 
     .. _EventLoop: https://docs.python.org/3/library/asyncio-eventloop.html#event-loop
     '''
+    HTTP_EXECUTOR = None
+    '''
+    `ThreadPoolExecutor`_.: Dedicated bounded pool for blocking api calls.
+
+    .. _ThreadPoolExecutor: https://docs.python.org/3/library/concurrent.futures.html
+    '''
+    USE_ASYNC_HTTP = False
+    'bool: Poll task status over the optional httpx async client.'
     CORO_TASKS = []
     '''
     list(`Task`_.): List of Tasks of Asynchronous I/O.
@@ -47,7 +58,8 @@ class Context:
         pass
 
     @classmethod
-    def create(cls, username, password, host):
+    def create(cls, username, password, host, http_workers=8,
+               use_async_http=False):
         """Create context instance and init neccessary variable and objects.
 
         Setting the user, password, and host for the funture connection when
@@ -58,6 +70,11 @@ class Context:
             username (str): User name for login Decanter Core server
             password (str): Password name for login Decanter Core server
             host (str): Decanter Core server URL.
+            http_workers (:obj:`int`, optional): Max number of threads for
+                blocking api calls. Defaults to 8.
+            use_async_http (:obj:`bool`, optional): Poll task status over
+                the httpx async client. Needs the `async` extra installed.
+                Defaults to False.
 
         Returns:
             :class:`~decanter.core.context.Context>`
@@ -78,6 +95,19 @@ class Context:
             asyncio.set_event_loop(asyncio.new_event_loop())
             Context.LOOP = asyncio.get_event_loop()
             logger.debug('[Context] create and set new event loop')
+        # don't strand the previous pool's threads when create is called
+        # again without an intervening close
+        if Context.HTTP_EXECUTOR is not None:
+            Context.HTTP_EXECUTOR.shutdown()
+        Context.HTTP_EXECUTOR = ThreadPoolExecutor(
+            max_workers=http_workers, thread_name_prefix='decanter-http')
+        Context.USE_ASYNC_HTTP = False
+        if use_async_http:
+            if CoreAPI.has_async():
+                Context.USE_ASYNC_HTTP = True
+            else:
+                logger.warning(
+                    '[Context] httpx not installed, async http disabled')
         context.healthy()
         return context
 
@@ -116,6 +146,11 @@ class Context:
                 logger.info('[Context] close event loop successfully')
         else:
             logger.info('[Context] no event loop to close')
+        if Context.HTTP_EXECUTOR is not None:
+            Context.HTTP_EXECUTOR.shutdown()
+            Context.HTTP_EXECUTOR = None
+            logger.debug('[Context] shutdown http executor')
+        Context.USE_ASYNC_HTTP = False
         logger.debug('[Context] remain CORO TASKS %s', len(Context.CORO_TASKS))
         Context.JOBS = []
         Context.CORO_TASKS = []
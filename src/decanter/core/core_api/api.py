@@ -15,12 +15,43 @@ from urllib3.exceptions import InsecureRequestWarning
 
 import decanter.core as core
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 logger = logging.getLogger(__name__)
 requests.packages.urllib3.disable_warnings()
 
+# single pooled session shared by every CoreAPI call, so connections
+# (and TLS handshakes) are reused across tasks instead of per request
+_session = requests.Session()
+
+_async_client = None
+
+
+def _get_async_client():
+    """Return the shared `httpx.AsyncClient`, creating it on first use."""
+    global _async_client  # pylint: disable=global-statement
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(
+            verify=False, limits=httpx.Limits(max_connections=100))
+    return _async_client
+
 
 class CoreAPI:
-    """Handle sending Decanter Core API requests."""
+    """Handle sending Decanter Core API requests.
+
+    CoreAPI() always hands back one shared instance, so every task and
+    job sends requests through the same pooled session.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __init__(self):
         self._corex_headers = {'user': 'sdk'}
 
@@ -58,17 +89,17 @@ class CoreAPI:
         url = core.Context.HOST + url
         try:
             if http == 'GET':
-                return requests.get(url=url, auth=basic_auth, verify=False)
+                return _session.get(url=url, auth=basic_auth, verify=False)
             if http == 'POST':
-                return requests.post(
+                return _session.post(
                     url=url, json=json, data=data,
                     files=files, auth=basic_auth, verify=False, headers=headers)
             if http == 'PUT':
-                return requests.put(
+                return _session.put(
                     url=url, json=json, data=data,
                     files=files, auth=basic_auth, verify=False, headers=headers)
             if http == 'DELETE':
-                return requests.delete(
+                return _session.delete(
                     url=url, json=json, data=data,
                     files=files, auth=basic_auth, verify=False)
 
@@ -78,6 +109,50 @@ class CoreAPI:
             logger.error('[Core] Request Failed :(')
             raise Exception(err)
 
+    @staticmethod
+    def has_async():
+        """Return True if the async api variants are available.
+
+        Async variants need the optional httpx package; without it
+        callers fall back to running the blocking methods in a thread.
+        """
+        return httpx is not None
+
+    @staticmethod
+    async def arequests_(http, url):
+        """Async variant of :func:`requests_` using a shared httpx client.
+
+        Polling only needs GET, so the async path skips body, file and
+        header handling.
+
+        Args:
+            http: string, http method.
+            url: string, url endpoint.
+
+        Returns:
+            class:`httpx.Response <Response>` object
+
+        Raises:
+            Exception: Occurred when raises HTTPError.
+        """
+        auth = (core.Context.USERNAME, core.Context.PASSWORD)
+        url = core.Context.HOST + url
+        try:
+            return await _get_async_client().request(http, url, auth=auth)
+        except httpx.HTTPError as err:
+            logger.error('[Core] Request Failed :(')
+            raise Exception(err)
+
+    async def aget_tasks_by_id(self, task_id):
+        """Async variant of :func:`get_tasks_by_id`.
+
+        Endpoint: /tasks/{task_id}
+
+        Returns:
+            class:`httpx.Response <Response>` object
+        """
+        return await self.arequests_(http='GET', url='/tasks/%s' % task_id)
+
     def get_info(self):
         """Get list of available time series algorithms
 
@@ -1,22 +1,43 @@
 """Init jobs package"""
+from functools import lru_cache
+
 from .evaluators import Evaluator
 from .algorithms import Algo
 from .time_units import TimeUnit
 from .numerical_group_by_methods import NumericalGroupByMethod
 from .categorical_group_by_method import CategoricalGroupByMethod
 
+
+@lru_cache(maxsize=None)
+def _valid_names(Enum):
+    """Return the frozenset of valid member names, cached per Enum class."""
+    return frozenset(Enum.__members__)
+
+
+def _handle_str(Enum, enum):
+    """Validate a member name against the cached names of Enum."""
+    if enum in _valid_names(Enum):
+        return enum
+    raise AttributeError(enum)
+
+
+def _handle_none(Enum, enum):
+    return None
+
+
+# dispatch on type(enum) to skip the isinstance chain on the hot path
+_HANDLERS = {
+    str: _handle_str,
+    type(None): _handle_none
+}
+
+
 # checks if enum is enumerated in Enum
 # Throws AttributeError if not in Enum; returns enum as str otherwise
 def check_is_enum(Enum, enum):
-	if isinstance(enum, str):
-		enum_isStr = eval('%s.%s'%(Enum.__name__, enum))
-		if enum_isStr in Enum:
-			return enum
-		else:
-			raise AttributeError(evaluator)
-	elif isinstance(enum, Enum):
-		return enum.value
-	elif enum == None:
-		return None
-	else:
-		raise AttributeError("[%s] Type Error"%type(enum).__name__)
+    handler = _HANDLERS.get(type(enum))
+    if handler is not None:
+        return handler(Enum, enum)
+    if isinstance(enum, Enum):
+        return enum.value
+    raise AttributeError("[%s] Type Error" % type(enum).__name__)
@@ -1,12 +1,19 @@
 """
 Functions support other modules.
 """
-import uuid
+import itertools
+import os
+
+# pid prefix keeps generated ids distinct across processes
+_ID_PREFIX = str(os.getpid())
+_COUNTER = itertools.count()
 
 def check_response(response, key=None):
     """CHeck the api response.
 
     Make sure the status call is successful and the response have specific key.
+    The JSON body is parsed only once and memoized on the response object as
+    `_parsed`, so callers can reuse it instead of calling `.json()` again.
 
     Return:
         class: `Response <Response>`
@@ -15,25 +22,43 @@ def check_response(response, key=None):
     if not 200 <= code < 300:
         raise Exception(f'[Decanter Core response Error] Request Error: {response.text}')
 
-    if key is not None and key not in response.json():
+    body = getattr(response, '_parsed', None)
+    if body is None:
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        response._parsed = body
+
+    if key is not None and (body is None or key not in body):
         raise KeyError('[Decanter Core response Error] No key value')
 
-    if 'error' in response.json():
+    if body is not None and 'error' in body:
         raise Exception(
-            f"[Decanter Core response Error] Request Error: {response.json()['error']['description']}")
+            f"[Decanter Core response Error] Request Error: {body['error']['description']}")
 
     return response
 
 
+def parse_response(response, key=None):
+    """Check the api response and return its parsed JSON body.
+
+    Single-parse shortcut over :func:`check_response` for callers that
+    only need the JSON payload.
+
+    Return:
+        :obj:`dict`
+    """
+    return check_response(response, key=key)._parsed
+
+
 def gen_id(type_, name):
-    """Generate a random UUID if name isn't given.
+    """Generate a sequential id if name isn't given.
     Returns:
         string
     """
     if name is None:
-        rand_id = uuid.uuid4()
-        rand_id = str(rand_id)[:8]
-        name = type_ + '_' + rand_id
+        name = '%s_%s-%d' % (type_, _ID_PREFIX, next(_COUNTER))
 
     return name
 
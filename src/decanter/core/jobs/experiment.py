@@ -104,6 +104,9 @@ class Experiment(Job):
             return
         class_ = self.__class__.__name__
         logger.debug('[%s] \'%s\' get best model', class_, self.name)
+        if self.attributes is None or self.hyperparameters is None:
+            logger.error('[%s] no models in %s result', class_, self.name)
+            return
         model_list = self.attributes
         select_by_evaluator = Evaluator.resolve_select_model_by(self.select_model_by, self.hyperparameters['model_type'])
         minlevel = {Evaluator.mse.value, Evaluator.mae.value, Evaluator.mean_per_class_error.value,
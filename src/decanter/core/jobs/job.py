@@ -108,10 +108,17 @@ class Job:
         self.status = CoreStatus.RUNNING
         self.task.run()
 
+        # poll again right away while the task advances; back off
+        # exponentially (100ms up to 2s) once it stops making progress
+        backoff = 0.1
         while self.task.not_done():
             await self.update()
             if self.task.not_done():
-                await asyncio.sleep(3)
+                if self.task.progress_changed:
+                    backoff = 0.1
+                    continue
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 2)
 
         self.status = self.task.status
         logger.info(
@@ -5,25 +5,118 @@ Handle the completion of tasks such as upload data, train, prediction...ect.
 Return the result to Job.
 """
 import abc
+import asyncio
 import logging
 
-from functools import partial
-
 from decanter.core import Context
 from decanter.core.core_api import CoreAPI
 from decanter.core.extra import CoreStatus, CoreKeys
-from decanter.core.extra.utils import check_response, isnotebook, gen_id
+from decanter.core.extra.utils import check_response, parse_response,\
+                                      isnotebook, gen_id
+
+def _resolve_tqdm():
+    """Pick the tqdm flavour once at import time.
 
-try:
+    The notebook widget is only usable under a Jupyter kernel; plain
+    tqdm is used everywhere else.
+    """
     if isnotebook():
-        raise ImportError
-except ImportError:
-    from tqdm.notebook import tqdm
-else:
-    from tqdm import tqdm
+        from tqdm.notebook import tqdm
+    else:
+        from tqdm import tqdm
+    return tqdm
+
+
+tqdm_cls = _resolve_tqdm()
 
 logger = logging.getLogger(__name__)
 
+# response fields mirrored onto CoreTask attributes, precomputed once as
+# (attribute name, response key) string pairs
+_RESP_FIELDS = tuple(
+    (key.name, key.value)
+    for key in (CoreKeys.id, CoreKeys.progress, CoreKeys.result, CoreKeys.status))
+_PROGRESS_KEY = CoreKeys.progress.value
+_MISS = object()
+
+
+class TaskStatusBatcher:
+    """Coalesce concurrent task status polls into batched fetches.
+
+    Polls submitted within `max_wait_ms` of each other are gathered into
+    one sweep and fetched together under a bounded number of concurrent
+    api calls, so a polling tick over many live tasks does not burst
+    into unthrottled HTTP round-trips. Lookups for a task id that is
+    already pending or in flight share the first caller's request
+    instead of issuing their own.
+    """
+    def __init__(self, max_wait_ms=50, max_concurrency=8):
+        self.max_wait = max_wait_ms / 1000
+        self.max_concurrency = max_concurrency
+        self._loop = None
+        self._pending = []
+        self._inflight = {}
+        self._flusher = None
+
+    def _bind_loop(self):
+        """Drop state bound to a previous event loop.
+
+        A session can abort while a flush is pending (failed poll,
+        KeyboardInterrupt), leaving a stale flusher task and futures
+        attached to a torn-down loop. Once Context switches loops that
+        state is unusable and must not block polls of the new session.
+        """
+        if self._loop is not Context.LOOP:
+            self._loop = Context.LOOP
+            self._pending = []
+            self._inflight = {}
+            self._flusher = None
+
+    async def submit(self, core_service, task_id):
+        """Return the api response for task_id from the next batch fetch."""
+        self._bind_loop()
+        fut = self._inflight.get(task_id)
+        if fut is not None:
+            return await fut
+        fut = Context.LOOP.create_future()
+        self._inflight[task_id] = fut
+        self._pending.append((core_service, task_id, fut))
+        if self._flusher is None or self._flusher.done():
+            self._flusher = Context.LOOP.create_task(self._flush())
+        return await fut
+
+    async def _flush(self):
+        """Fetch every pending task id accumulated during the wait window."""
+        await asyncio.sleep(self.max_wait)
+        pending, self._pending = self._pending, []
+        self._flusher = None
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(core_service, task_id, fut):
+            async with semaphore:
+                try:
+                    if Context.USE_ASYNC_HTTP:
+                        response = await core_service.aget_tasks_by_id(task_id)
+                    else:
+                        response = await Context.LOOP.run_in_executor(
+                            Context.HTTP_EXECUTOR,
+                            core_service.get_tasks_by_id, task_id)
+                except Exception as err:  # pylint: disable=broad-except
+                    if not fut.done():
+                        fut.set_exception(err)
+                else:
+                    if not fut.done():
+                        fut.set_result(response)
+                finally:
+                    self._inflight.pop(task_id, None)
+
+        await asyncio.gather(*(
+            fetch(core_service, task_id, fut)
+            for core_service, task_id, fut in pending))
+
+
+_STATUS_BATCHER = TaskStatusBatcher()
+
 
 class Task:
     """Handle Action's result.
@@ -36,12 +129,15 @@ class Task:
         status (str): Status of task.
         result (value of the task result): The result of executing the task.
         name (str): Name of task for tracking process.
+        progress_changed (bool): True if the last update advanced progress.
     """
+    __slots__ = ('status', 'result', 'name', 'progress_changed')
 
     def __init__(self, name=None):
         self.status = CoreStatus.PENDING
         self.result = None
         self.name = name
+        self.progress_changed = False
 
     def is_done(self):
         """
@@ -104,8 +200,29 @@ class CoreTask(Task):
         progress (float): Progress of the task process.
         name (str): Name of task for tracking process.
     """
-    BAR_CNT = 0
-    'int: The position of progress bar to avoid overlapping.'
+    __slots__ = ('core_service', 'id', 'response', 'progress', 'pbar',
+                 '_pending_progress')
+
+    VERBOSE = True
+    'bool: Set to False to silence the progress bar.'
+    _global_pbar = None
+    '`tqdm`: Single progress bar shared by all live CoreTasks.'
+
+    @classmethod
+    def _get_pbar(cls):
+        """Return the shared progress bar, growing its total by one task.
+
+        The bar is created lazily on the first running task, and is
+        disabled when `VERBOSE` is False or stderr is not a terminal.
+        """
+        if cls._global_pbar is None:
+            cls._global_pbar = tqdm_cls(
+                total=0, leave=True, bar_format='{l_bar}{bar}',
+                desc='Progress', mininterval=0.5, miniters=1,
+                disable=None if cls.VERBOSE else True)
+        cls._global_pbar.total += 100
+        cls._global_pbar.refresh()
+        return cls._global_pbar
 
     def __init__(self, name=None):
         super().__init__(name=name)
@@ -114,6 +231,7 @@ class CoreTask(Task):
         self.response = None
         self.progress = 0
         self.pbar = None
+        self._pending_progress = 0
 
     async def update(self):
         """Update the response from Decanter server.
@@ -121,11 +239,10 @@ class CoreTask(Task):
         Get the task from sending api request and update the result
         of response.
         """
-        func = partial(self.core_service.get_tasks_by_id, task_id=self.id)
-        self.response = await Context.LOOP.run_in_executor(None, func)
+        self.response = await _STATUS_BATCHER.submit(self.core_service, self.id)
         if self.status in CoreStatus.DONE_STATUS:
             return
-        self.response = check_response(self.response).json()
+        self.response = parse_response(self.response)
         self.update_task_response()
         logger.debug(
             '[Task]\'%s\' done update. status: %s', self.name, self.status)
@@ -140,27 +257,24 @@ class CoreTask(Task):
             '[Task] \'%s\' start update task resp. status: %s',
             self.name, self.status)
 
+        self.progress_changed = False
+
         def update_pbar(resp_progress):
-            diff = int((resp_progress - self.progress)*100)
-            self.pbar.update(diff)
+            self.progress_changed = resp_progress != self.progress
+            self._pending_progress += int((resp_progress - self.progress)*100)
             self.progress = resp_progress
-
-        for key_ in [CoreKeys.id, CoreKeys.progress, CoreKeys.result, CoreKeys.status]:
-            attr, key = key_.name, key_.value
-            try:
-                if key_ == CoreKeys.progress:
-                    update_pbar(self.response[key])
-                setattr(self, attr, self.response[key])
-            except KeyError as err:
-                logger.debug(str(err))
-
-    @abc.abstractmethod
-    def run(self):
-        """Execute Decanter Core task.
-        Raises:
-            NotImplementedError: If child class do not implement this function.
-        """
-        raise NotImplementedError('Please Implement run method in CoreTask')
+            # batch tiny diffs; only touch the bar on real progress or when done
+            if self._pending_progress >= 1 or self.status in CoreStatus.DONE_STATUS:
+                self.pbar.update(self._pending_progress)
+                self._pending_progress = 0
+
+        for attr, key in _RESP_FIELDS:
+            val = self.response.get(key, _MISS)
+            if val is _MISS:
+                continue
+            if key == _PROGRESS_KEY:
+                update_pbar(val)
+            setattr(self, attr, val)
 
     def run_core_task(self, api_func, **kwargs):
         """Start running Decanter Core task by calling api_func.
@@ -170,18 +284,14 @@ class CoreTask(Task):
             kwargs: Parameters for api_func.
         """
         logger.debug('[%s] \'%s\' start.', self.__class__.__name__, self.name)
-        self.response = check_response(
+        self.response = parse_response(
             api_func(**kwargs), key=CoreKeys.id.value)
-        self.response = self.response.json()
         self.id = self.response[CoreKeys.id.value]
         logger.debug(
             '[%s] \'%s\' upload task id: %s',
             self.__class__.__name__, self.name, self.id)
 
-        self.pbar = tqdm(
-            total=100, position=CoreTask.BAR_CNT, leave=True,
-            bar_format='{l_bar}{bar}', desc='Progress %s' % self.name)
-        CoreTask.BAR_CNT += 1
+        self.pbar = CoreTask._get_pbar()
 
         self.status = CoreStatus.RUNNING
 
@@ -204,6 +314,8 @@ class UploadTask(CoreTask):
     Attributes:
         file (csv-file-object): The csv file to be uploaded.
     """
+    __slots__ = ('file',)
+
     def __init__(self, file, name=None):
         super().__init__(name=gen_id('UploadTask', name))
         self.file = file
@@ -223,6 +335,8 @@ class TrainTask(CoreTask):
         train_input (:class:`~decanter.core.core_api.train_input.TrainInput`):
             Settings for training.
     """
+    __slots__ = ('train_input',)
+
     def __init__(self, train_input, name=None):
         super().__init__(name=gen_id('TrainTask', name))
         self.train_input = train_input
@@ -240,6 +354,8 @@ class TrainTSTask(CoreTask):
         train_input (:class:`~decanter.core.core_api.train_input.TrainTSInput`):
             Settings for training time series forecast models.
     """
+    __slots__ = ('train_input',)
+
     def __init__(self, train_input, name=None):
         super().__init__(name=gen_id('TrainTSTask', name))
         self.train_input = train_input
@@ -259,6 +375,8 @@ class PredictTask(CoreTask):
         predict_input (:class:`~decanter.core.core_api.predict_input.PredictInput`):
             Settings for prediction.
     """
+    __slots__ = ('predict_input',)
+
     def __init__(self, predict_input, name=None):
         super().__init__(name=gen_id('PredictTask', name))
         self.predict_input = predict_input
@@ -279,6 +397,8 @@ class PredictTSTask(CoreTask):
             (:class:`~decanter.core.core_api.predict_input.PredictTSInput`):
             Settings for time series prediction.
     """
+    __slots__ = ('predict_input',)
+
     def __init__(self, predict_input, name=None):
         super().__init__(name=gen_id('PredictTSTask', name))
         self.predict_input = predict_input
@@ -300,6 +420,8 @@ class SetupTask(CoreTask):
         setup_input (:class:`~decanter.core.core_api.setup_input.SetupInput`):
             Settings for set up data.
     """
+    __slots__ = ('setup_input',)
+
     def __init__(self, setup_input, name='Setup'):
         super().__init__(name=name)
         self.setup_input = setup_input
@@ -18,7 +18,7 @@ from decanter.core.jobs import DataUpload, Experiment, ExperimentTS
 USR = 'test-usr'
 PWD = 'test-pwd'
 HOST = 'http://mobagel.test'
-TEST_HEALTHY_URL = 'http://mobagel.test/data/test'
+TEST_HEALTHY_URL = 'http://mobagel.test/worker/status'
 UPLOAD_ID = '4uploadid'
 TRAIN_ID = '4traintaskid'
 PREDICT_ID = '4predtaskid'
@@ -49,11 +49,11 @@ best_model = Model()
 best_multi_model = MultiModel()
 best_multi_model.id = best_model.id = MODEL_ID
 
-train_input = TrainInput(data=data, target='test-target', algos=['test-algo'])
+train_input = TrainInput(data=data, target='test-target', algos=['GBM'])
 train_ts_input = TrainTSInput(
     data=data, target='test', datetime_column='test',
     endogenous_features=['test'], forecast_horizon='test', gap='test',
-    time_unit='test', regression_method='test', classification_method='test',
+    time_unit='hour', max_iteration=10,
     max_window_for_feature_derivation='test')
 
 
@@ -107,8 +107,8 @@ def get_urls(action, task=None):
         'upload': lambda task: '/v2/upload',
         'train': lambda task: '/v2/tasks/train',
         'predict': lambda task: '/v2/tasks/predict',
-        'train_ts': lambda task: '/v2/tasks/train_time_series',
-        'predict_ts': lambda task: '/v2/tasks/predict/tsmodel',
+        'train_ts': lambda task: '/v2/tasks/auto_ts/train',
+        'predict_ts': lambda task: '/v2/tasks/auto_ts/predict',
         'stop': lambda task: '/tasks/' + global_data[task] + '/stop',
         'task': lambda task: '/tasks/' + global_data[task]
     }
@@ -118,7 +118,7 @@ def get_urls(action, task=None):
 @pytest.fixture(scope='session')
 def client():
     """Return class:`CoreClient <CoreClient>` for unittests."""
-    return CoreClient()
+    return CoreClient
 
 
 @pytest.fixture(scope='session')
@@ -174,7 +174,7 @@ def context_fixture():
     def mock_request_body(cond):
         return {
             'Healthy':
-                {'status': 400},
+                {'json': {}, 'status': 200},
             'AuthFailed':
                 {'json': {}, 'status': 405},
             'RequestException':
@@ -184,7 +184,7 @@ def context_fixture():
     def mocked_context(cond):
         params = mock_request_body(cond)
         responses.add(
-            responses.DELETE, TEST_HEALTHY_URL, **params)
+            responses.GET, TEST_HEALTHY_URL, **params)
         context = Context.create(username=USR, password=PWD, host=HOST)
         context_.append(context)
         return context
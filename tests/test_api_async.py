@@ -0,0 +1,50 @@
+"""Test the optional httpx-backed async api variants."""
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip('httpx')
+
+from decanter.core import Context
+from decanter.core.core_api import api as core_api
+
+
+def run_coro(coro):
+    """Run coro on a private loop, leaving the thread's loop untouched."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@pytest.fixture
+def async_client(monkeypatch):
+    """Route the shared async client through a httpx mock transport."""
+    def handler(request):
+        assert request.headers.get('authorization') is not None
+        if request.url.path == '/tasks/4taskid':
+            return httpx.Response(
+                200, json={'_id': '4taskid', 'status': 'done'})
+        raise httpx.ConnectError('mock refused', request=request)
+
+    monkeypatch.setattr(
+        core_api, '_async_client',
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(Context, 'USERNAME', 'test-usr')
+    monkeypatch.setattr(Context, 'PASSWORD', 'test-pwd')
+    monkeypatch.setattr(Context, 'HOST', 'http://mobagel.test')
+
+
+def test_aget_tasks_by_id(async_client):
+    """aget_tasks_by_id fetches the task through the async client."""
+    response = run_coro(core_api.CoreAPI().aget_tasks_by_id('4taskid'))
+
+    assert response.status_code == 200
+    assert response.json()['status'] == 'done'
+
+
+def test_arequests_error(async_client):
+    """arequests_ wraps transport errors in Exception."""
+    with pytest.raises(Exception, match='mock refused'):
+        run_coro(core_api.CoreAPI().arequests_('GET', '/tasks/unknown'))
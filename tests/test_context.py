@@ -4,6 +4,7 @@ import pytest
 import responses
 
 from decanter.core import Context
+from decanter.core.core_api import TrainInput
 from decanter.core.extra import CoreStatus
 
 
@@ -146,22 +147,18 @@ def test_get_all_jobs(
 
 @responses.activate
 def test_get_jobs_status(
-        globals, urls, client, mock_test_responses, context_fixture):
+        globals, client, mock_test_responses, context_fixture):
     """Context shows jobs status in dataframe with specific status."""
 
     context = context_fixture('Healthy')
     mock_test_responses(task='upload', status=CoreStatus.DONE)
-    responses.add(
-        responses.GET, urls('task', 'upload'),
-        json={
-            '_id': globals['upload'],
-            'status': CoreStatus.FAIL
-        },
-        status=200,
-        content_type='application/json')
 
-    for i in range(2):
-        client.upload(file=globals['test_csv_file'], name=str(i))
+    client.upload(file=globals['test_csv_file'], name='0')
+    client.train(
+        train_input=TrainInput(
+            data=globals['fail_data'], target='test-target',
+            algos=['GBM']),
+        name='1')
 
     context.run()
     job_fail = context.get_jobs_status(status=['fail'])
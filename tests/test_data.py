@@ -81,7 +81,7 @@ def test_data_stop(
         data = client.upload(file=globals['test_csv_file'])
 
     exp = client.train(TrainInput(
-        data=data, target='test-target', algos=['test-algo']))
+        data=data, target='test-target', algos=['GBM']))
     cancel_task = Context.LOOP.create_task(cancel(data))
     Context.CORO_TASKS.append(cancel_task)
     context.run()
@@ -0,0 +1,34 @@
+"""Test enum validation in check_is_enum."""
+import pytest
+
+from decanter.core.enums import check_is_enum
+from decanter.core.enums.algorithms import Algo
+from decanter.core.enums.evaluators import Evaluator
+
+
+def test_check_is_enum_valid_name():
+    """check_is_enum returns a valid member name unchanged."""
+    assert check_is_enum(Algo, 'GBM') == 'GBM'
+    assert check_is_enum(Evaluator, 'auto') == 'auto'
+
+
+def test_check_is_enum_invalid_name():
+    """check_is_enum raises AttributeError naming the invalid member."""
+    with pytest.raises(AttributeError, match='not-an-algo'):
+        check_is_enum(Algo, 'not-an-algo')
+
+
+def test_check_is_enum_member():
+    """check_is_enum returns the value of an Enum member."""
+    assert check_is_enum(Algo, Algo.XGBoost) == 'XGBoost'
+
+
+def test_check_is_enum_none():
+    """check_is_enum passes None through."""
+    assert check_is_enum(Algo, None) is None
+
+
+def test_check_is_enum_wrong_type():
+    """check_is_enum raises AttributeError on unsupported types."""
+    with pytest.raises(AttributeError, match='Type Error'):
+        check_is_enum(Algo, 1)
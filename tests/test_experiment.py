@@ -22,9 +22,7 @@ def get_train_ts_input(data):
                 datetime_column='test',
                 endogenous_features=['test'],
                 forecast_horizon='test',
-                gap='test', time_unit='test',
-                regression_method='test',
-                classification_method='test',
+                gap='test', time_unit='hour', max_iteration=10,
                 max_window_for_feature_derivation='test')
 
 
@@ -69,7 +67,7 @@ def test_exp_fail_by_data(
     exp = client.train(
         train_input=TrainInput(
             data=globals['fail_data'], target='test-target',
-            algos=['test-algo']))
+            algos=['GBM']))
 
     context.run()
 